@@ -8,67 +8,94 @@ During the simulation you can return to the menu by pressing any button on the k
 import pygame
 from weather import Weather
 
+
+class Button:
+    """
+    A simple button class for the GUI.
+
+    :param text: The text to display on the button.
+    :param position: The position of the button as a tuple (x, y).
+    :param size: The size of the button as a tuple (width, height).
+    :param colors: A tuple containing two colors (default, hovered).
+    """
+    font = None  # Shared by all buttons, created on first use once pygame.font is initialized
+
+    def __init__(self, text: str, position: tuple[int, int], size: tuple[int, int], state = False,
+                colors: tuple[tuple[int, int, int], tuple[int, int, int]] = ((100, 100, 100), (150, 150, 150))):
+        self.text = text
+        self.base_text = text  # Label without the "[ON]" suffix
+        self.position = position
+        self.size = size
+        self.colors = colors
+        self.orig_colors  = colors
+        self.rect = pygame.Rect(position, size)
+        self.color = colors[0]
+        self.hovered = False
+        if Button.font is None:
+            Button.font = pygame.font.Font(None, 36)
+        self.state = state
+        self._rebuild_text()
+
+    def _rebuild_text(self) -> None:
+        """Render the button text once and keep it until the text changes."""
+        self._text_surf = self.font.render(self.text, True, (255, 255, 255))
+        self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the button on the screen."""
+        pygame.draw.rect(screen, self.color, self.rect)
+        screen.blit(self._text_surf, self._text_rect)
+
+    def check_hover(self, mouse_pos: tuple[int, int]) -> None:
+        """Change the button color if hovered."""
+        self.set_hover(self.rect.collidepoint(mouse_pos))
+
+    def set_hover(self, hovered: bool) -> None:
+        """Set whether the mouse is over the button and update its color."""
+        self.hovered = hovered
+        self.color = self.colors[1] if hovered else self.colors[0]
+
+    def is_clicked(self, mouse_pos: tuple[int, int]) -> bool:
+        """Check if the button is clicked."""
+        return self.rect.collidepoint(mouse_pos)
+
+    def toggle(self) -> None:
+        """Toggle the state of the button and update its color."""
+        self.state = not self.state
+        self.colors = ((0, 120, 0),(0, 190, 0)) if self.state else self.orig_colors  # Green if toggled on
+        self.text = self.base_text + (' [ON]' if self.state else '')  # Add "[ON]" to text if toggled
+        self._rebuild_text()
+        self.set_hover(self.hovered)
+
+    def reset(self) -> None:
+        """Switch the button off, restoring its original colors and text."""
+        self.state = False
+        self.colors = self.orig_colors
+        self.text = self.base_text
+        self._rebuild_text()
+        self.set_hover(self.hovered)
+
+    def toggle_side(self, wind_dir):
+        self.state = not self.state
+        self.text = "Right side wind" if not self.state else "Left side wind"
+        self._rebuild_text()
+        return -wind_dir
+
+
 def main():
 
-    class Button:
-        """
-        A simple button class for the GUI.
-
-        :param text: The text to display on the button.
-        :param position: The position of the button as a tuple (x, y).
-        :param size: The size of the button as a tuple (width, height).
-        :param colors: A tuple containing two colors (default, hovered).
-        """
-        def __init__(self, text: str, position: tuple[int, int], size: tuple[int, int], state = False,
-                    colors: tuple[tuple[int, int, int], tuple[int, int, int]] = ((100, 100, 100), (150, 150, 150))):
-            self.text = text
-            self.position = position
-            self.size = size
-            self.colors = colors
-            self.orig_colors  = colors
-            self.rect = pygame.Rect(position, size)
-            self.color = colors[0]
-            self.font = pygame.font.Font(None, 36)
-            self.state = state
-
-        def draw(self, screen: pygame.Surface) -> None:
-            """Draw the button on the screen."""
-            pygame.draw.rect(screen, self.color, self.rect)
-            text_surf = self.font.render(self.text, True, (255, 255, 255))
-            text_rect = text_surf.get_rect(center=self.rect.center)
-            screen.blit(text_surf, text_rect)
-
-        def check_hover(self, mouse_pos: tuple[int, int]) -> None:
-            """Change the button color if hovered."""
-            if self.rect.collidepoint(mouse_pos):
-                self.color = self.colors[1]
-            else:
-                self.color = self.colors[0]
-
-        def is_clicked(self, mouse_pos: tuple[int, int]) -> bool:
-            """Check if the button is clicked."""
-            return self.rect.collidepoint(mouse_pos)
-
-        def toggle(self) -> None:
-            """Toggle the state of the button and update its color."""
-            self.state = not self.state
-            self.colors = ((0, 120, 0),(0, 190, 0)) if self.state else self.orig_colors  # Green if toggled on
-            self.text = f'{self.text} [ON]' if self.state else self.text.split(' [')[0]  # Add "[ON]" to text if toggled
-            self.check_hover((0,0))
-
-        def toggle_side(self, wind_dir):
-            self.state = not self.state
-            self.text = "Right side wind" if not self.state else "Left side wind"
-            return -wind_dir
-
-        
-          
-
-    pygame.init()    
+    # Only the subsystems the GUI uses. The mixer is set up by the weather module on import
+    # and the timer is started by pygame.time.Clock.
+    pygame.display.init()
+    pygame.font.init()
     SCREENSIZE = 1200, 800
     screen = pygame.display.set_mode(SCREENSIZE)
     clock = pygame.time.Clock()
 
+    # Only queue the events the GUI handles, SDL drops everything else before it reaches Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE])
+
     # GUI Options
     weather_options = ['rain', 'acid rain', 'snow', 'hail', 'lightning', 'fog']
     wind_speeds = {'None':0, 'Low': 5, 'Medium': 15, 'High': 40, 'Extreme': 75}
@@ -89,7 +116,6 @@ def main():
     for speed in wind_speeds.keys():
         wind_buttons.append(Button(speed, (300, y_offset), (200, 50)))
         y_offset += 60
-    wind_buttons[0].toggle()
 
     pixel_button     = Button("Pixel Mode", (550, 50), (200, 50))
     side_wind_button = Button("Right side wind", (550, 150), (200, 50))
@@ -98,77 +124,122 @@ def main():
     all_buttons = weather_buttons + wind_buttons
     all_buttons.extend([pixel_button, side_wind_button, start_button])
 
+    # Rect lists for hit-testing a whole group of buttons with a single collidelist call
+    weather_rects = [b.rect for b in weather_buttons]
+    wind_rects    = [b.rect for b in wind_buttons]
+    right_rects   = [pixel_button.rect, side_wind_button.rect, start_button.rect]
+
+    # Bounding rect of each button column, so a whole column is skipped with one test.
+    # Each entry also holds the index of the column's first button in all_buttons.
+    columns = [(weather_rects[0].unionall(weather_rects), 0, weather_rects),
+               (wind_rects[0].unionall(wind_rects), len(weather_rects), wind_rects),
+               (right_rects[0].unionall(right_rects), len(weather_rects) + len(wind_rects), right_rects)]
+
+    def button_at(pos: tuple[int, int]) -> int:
+        """Return the index in all_buttons of the button at pos, or -1 if there is none."""
+        for bbox, first, rects in columns:
+            if bbox.collidepoint(pos):
+                i = pygame.Rect(pos, (1, 1)).collidelist(rects)
+                return first + i if i > -1 else -1
+        return -1
+
+    # Click handlers
+    def wind_click(button: Button) -> None:
+        nonlocal wind_speed
+        # Only one wind speed can be selected
+        for b in wind_buttons:
+            b.reset()
+        button.toggle()
+        wind_speed = wind_speeds[button.base_text]
+        dirty_rects.extend(wind_rects)
+
+    def pixel_click() -> None:
+        nonlocal pixel
+        pixel_button.toggle()
+        pixel = pixel_button.state
+
+    def side_wind_click() -> None:
+        nonlocal wind_dir
+        wind_dir = side_wind_button.toggle_side(wind_dir)
+
+    def start_click() -> None:
+        nonlocal selected_weather, simulation_on
+        selected_weather = [button.base_text for button in weather_buttons if button.state]
+        simulation_on = True
+
+    # Click handler of every button, in the same order as all_buttons
+    click_handlers = [button.toggle for button in weather_buttons]
+    click_handlers += [lambda b=button: wind_click(b) for button in wind_buttons]
+    click_handlers += [pixel_click, side_wind_click, start_click]
+
+    # Static menu backdrop with every button in its default look. Each repaint blits it
+    # and only draws on top the buttons that look different (hovered or switched on).
+    menu_bg = pygame.Surface(SCREENSIZE).convert()
+    menu_bg.fill((30, 30, 30))
+    for button in all_buttons:
+        button.draw(menu_bg)
+
+    wind_buttons[0].toggle()
+
     # State booleans
     simulation_on = False
     running = True
+    last_hover = -1  # Index in all_buttons of the hovered button, -1 if there is none
+    dirty_rects = [screen.get_rect()]  # Menu areas to repaint. Only these are redrawn and sent to the display
 
-    # Load images
-    bgrnd_px   = pygame.image.load(f'assets/weather/imgpix.webp').convert_alpha() 
-    bgrnd_norm = pygame.image.load(f'assets/weather/img.webp').convert_alpha() 
-    bgrnd_px   = pygame.transform.scale(bgrnd_px, (SCREENSIZE[0], SCREENSIZE[1]))
-    bgrnd_norm = pygame.transform.scale(bgrnd_norm, (SCREENSIZE[0], SCREENSIZE[1]))
+    # Load images. Backgrounds are opaque, so they are converted without per-pixel alpha for a plain blit
+    bgrnd_px   = pygame.image.load(f'assets/weather/imgpix.webp').convert() 
+    bgrnd_norm = pygame.image.load(f'assets/weather/img.webp').convert() 
+    bgrnd_px   = pygame.transform.scale(bgrnd_px, (SCREENSIZE[0], SCREENSIZE[1])).convert()
+    bgrnd_norm = pygame.transform.scale(bgrnd_norm, (SCREENSIZE[0], SCREENSIZE[1])).convert()
+    bgrnd_px.set_alpha(None)
+    bgrnd_norm.set_alpha(None)
 
     # Run the GUI loop
     while running:
-        screen.fill((30, 30, 30))
-
-        # Draw buttons 
-        for button in all_buttons:
-            button.draw(screen)
-
-        mouse_pos = pygame.mouse.get_pos()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                running = False
-                return
-
-            elif event.type == pygame.MOUSEMOTION:
-                # Check hover only on MOUSEMOTION
-                for button in all_buttons:
-                    button.check_hover(mouse_pos)
-
-
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        # Drain the queue by event type, so only the events handled here reach Python
+        if pygame.event.get(pygame.QUIT):
+            pygame.quit()
+            running = False
+            return
+
+        motion_events = pygame.event.get(pygame.MOUSEMOTION, pump=False)
+        if motion_events:
+            # Hover only needs the last mouse position
+            mouse_pos = motion_events[-1].pos
+            new_hover = button_at(mouse_pos)
+            # Colors only change when the mouse crosses a button boundary
+            if new_hover != last_hover:
+                if last_hover > -1:
+                    all_buttons[last_hover].set_hover(False)
+                    dirty_rects.append(all_buttons[last_hover].rect)
+                if new_hover > -1:
+                    all_buttons[new_hover].set_hover(True)
+                    dirty_rects.append(all_buttons[new_hover].rect)
+                last_hover = new_hover
+
+        for event in pygame.event.get(pygame.MOUSEBUTTONDOWN, pump=False):
+            if event.button == 1:
                 # Check clicks only on MOUSEBUTTONDOWN
-                for button in weather_buttons:
-                    if button.is_clicked(mouse_pos):
-                        button.toggle()
-
-                for button in wind_buttons:
-                    if button.is_clicked(mouse_pos):
-                        # Only one wind speed can be selected
-                        for b in wind_buttons:
-                            b.state = False
-                            b.colors = b.orig_colors
-                            b.text = b.text.split(' [')[0]
-                        button.toggle()
-                        wind_speed = wind_speeds[button.text.split(' [')[0]]
-                
-                if side_wind_button.is_clicked(mouse_pos):
-                    wind_dir = side_wind_button.toggle_side(wind_dir)
+                i = button_at(event.pos)
+                if i > -1:
+                    click_handlers[i]()
+                    dirty_rects.append(all_buttons[i].rect)
 
-                if pixel_button.is_clicked(mouse_pos):
-                    pixel_button.toggle()
-                    pixel = pixel_button.state
+        if pygame.event.get(pygame.VIDEOEXPOSE, pump=False):
+            dirty_rects.append(screen.get_rect())  # The window was uncovered, so the whole menu has to be repainted
 
-                if start_button.is_clicked(mouse_pos):
-                    selected_weather = [button.text.split(' [')[0] for button in weather_buttons if button.state]
-                    menu_on = False
-                    simulation_on = True
-                 
-        # Start the weather simulation if the user presses the Enter key
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_RETURN]:
-            selected_weather = [button.text.split(' [')[0] for button in weather_buttons if button.state]
-            simulation_on = True
+        for event in pygame.event.get(pygame.KEYDOWN, pump=False):
+            # Start the weather simulation if the user presses the Enter key
+            if event.key == pygame.K_RETURN:
+                start_click()
 
+        pygame.event.clear(pump=False)  # Discard the events the menu doesn't handle
 
         if simulation_on:
             weather = Weather(screen, weather_types=selected_weather, wind_speed=wind_speed * wind_dir, pixel=pixel)
             
-            print("simulating")
+            pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN])  # The simulation doesn't use the mouse
             while simulation_on:
 
                 for event in pygame.event.get():
@@ -179,30 +250,35 @@ def main():
                     # Check if the user presses Enter to return to the selection screen
                     elif event.type == pygame.KEYDOWN:
                         simulation_on = False
-                        menu_on = True
-                        print("key pressed")
                 
                 screen.blit(bgrnd_px, (0,0)) if pixel else screen.blit(bgrnd_norm, (0,0)) 
                 
                 weather.update()
                 pygame.display.flip()
                 clock.tick(60)
-                
-                if menu_on:
-                    # Reset the selected weather options
-                    for button in weather_buttons:
-                        button.state = False
-                        button.colors = button.orig_colors
-                        button.text = button.text.split(' [')[0]
 
-                    # Return to the button selection screen
-                    menu_on = True
-                    pygame.mixer.stop()
+            # Reset the selected weather options
+            for button in weather_buttons:
+                button.reset()
 
+            # Return to the button selection screen
+            pygame.mixer.stop()
+            pygame.event.set_allowed([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN])
+            dirty_rects.append(screen.get_rect())
 
         else:
-            pygame.display.flip()
-            clock.tick(60)
+            if dirty_rects:
+                for rect in dirty_rects:
+                    screen.blit(menu_bg, rect, rect)
+
+                # Draw the buttons that differ from the backdrop
+                for button in all_buttons:
+                    if button.state or button.hovered:
+                        button.draw(screen)
+
+                pygame.display.update(dirty_rects)
+                dirty_rects.clear()
+            clock.tick(30)  # The menu doesn't need 60 fps
 
 if __name__ == '__main__':
     main()
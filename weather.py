@@ -10,11 +10,22 @@
 import pygame
 import random
 import math
+import functools
+import collections
 pygame.mixer.init(frequency = 44100, size = -16, buffer = 2**12) 
 pygame.mixer.set_num_channels(24)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_sound(path: str) -> pygame.mixer.Sound:
+    """Load and decode a sound file only the first time it is requested."""
+    return pygame.mixer.Sound(path)
+
+
 class Weather:
+
+    # Order in which the effects are drawn, from the back to the front
+    DRAW_ORDER = ('lightning', 'fog', 'snow', 'rain', 'acid rain', 'hail')
     
     def __init__(self, screen: pygame.Surface, weather_types: list[str] = None, wind_speed: int = 30, pixel: bool = False):
         """
@@ -32,13 +43,14 @@ class Weather:
         self.effects:dict = {} # dict that contains all current weather conditions. The key is a string and ther value the class itself. 
 
         self.general_vol:float = 1.0  # From 0.0 to 1.0: Volume modificator for all sounds. 
-        self.sounds: list = []        # Empty list to store all sounds before playing them
+        self.sounds: collections.deque = collections.deque() # Queue to store all sounds before playing them
         self.channels: dict = {}      # Empty dict to store all the channels playing sounds and their initial volume 
         self.timer:int = 0            # Used to store time for the delay playing different sounds
 
         if weather_types is None:
             pass
         else:
+            weather_types = frozenset(weather_types) # Tested once per effect below
             if wind_speed:
                 self.wind = Wind(self, wind_speed, sound = True)  
 
@@ -64,49 +76,47 @@ class Weather:
             if 'fog' in weather_types:
                 self.effects['fog'] = Fog(screen, pixel=self.pixel)
 
-        self.initial_sounds = self.sounds.copy()
+        self._num_initial_sounds = len(self.sounds)
+        self._order_effects()
+
+    def _order_effects(self) -> None:
+        """Store the active effects in drawing order, so update doesn't look them up every frame."""
+        self._ordered_effects = tuple(self.effects[name] for name in self.DRAW_ORDER if name in self.effects)
 
     def update(self) -> None:
         """
-        Update and render all active weather effects.
+        Update and render all active weather effects. The caller presents the frame with pygame.display.flip().
         """
         
+        now = pygame.time.get_ticks() # A single time for every effect in this frame
+
         # Update wind and apply to other effects
-        current_wind_speed = self.wind.update(self) if self.wind_speed else 0
+        current_wind_speed = self.wind.update(self, now) if self.wind_speed else 0
         
         # Update each other weather effect
-        upd_rects = []
-
-        for effect_name in ['lightning', 'fog', 'snow', 'rain', 'acid rain', 'hail']:
-            if effect_name in self.effects:
-                updated_rect = self.effects[effect_name].update(current_wind_speed)
-                if updated_rect is not None:
-                    upd_rects.extend(updated_rect)
-
-        pygame.display.update(upd_rects)  # Update only the rectangles that are changed
+        for effect in self._ordered_effects:
+            effect.update(current_wind_speed, now)
         
         #Play sounds
         if self.sounds:
-            new_timer = (pygame.time.get_ticks()//656 + 1) % 20            
+            new_timer = (now//656 + 1) % 20            
             if new_timer > self.timer:
-                volume = 1.5/(len(self.initial_sounds))    
+                volume = 1.5/self._num_initial_sounds
                 
                 self.timer = new_timer
 
                 channel = pygame.mixer.find_channel() # Looks for an empty channel 
-                channel.play(self.sounds[0], -1) # Plays sound on this channel in a loop
+                channel.play(self.sounds.popleft(), -1) # Plays sound on this channel in a loop and removes it from the queue
                 
                 channel.set_volume(volume*self.general_vol)  
                 self.channels[channel] = volume
-
-                self.sounds.pop(0) # Removes the sound from the list when it is already playing in loop 
-                # print(f'sec:{new_timer} playing sound at {volume*self.general_vol*100 :.0f}% volume. {len(self.sounds)} left to play')
         
 
     def toggle_effect(self, effect_name: str) -> None:
         """Toggle the visibility of a specific weather effect."""
         if effect_name in self.effects:
             del self.effects[effect_name]
+            self._order_effects()
         else:
             self.__init__(self.screen, [effect_name] + list(self.effects.keys()))
 
@@ -177,42 +187,54 @@ class Wind:
         self.w_timer = 0 # Used to store time for the delay playing different wind sounds
 
         self.start_time = pygame.time.get_ticks()
+
+        # Terms of the speed that only change on reset
+        self._dif_speed = (base_max_speed * amplitude) // 100
+        self._mean_speed = base_max_speed - self._dif_speed
+        self._base_omega = 2 * math.pi * freq_base / 1000  # Angular frequency of the base wind, per second
+        self._gust_omega = 2 * math.pi * freq_gusts / 500  # Angular frequency of the gusts, per second
+        self._last_gusts_var = 0.0 # Highest gust harmonic in the last update, to detect when it crosses 0
         
         # Play sounds
         if sound: 
             for i in range(3):
-                sound = pygame.mixer.Sound(f'assets/weather/wind/{i+1}.mp3')
+                sound = _load_sound(f'assets/weather/wind/{i+1}.mp3')
                 self.wind_sounds.append(sound) 
                 pygame.mixer.find_channel().play(self.wind_sounds[i], -1)
 
         # Update speed at init
-        self.update(weather)
+        self.update(weather, self.start_time)
             
 
-    def update(self, weather) -> float:
+    def update(self, weather, now: int | None = None) -> float:
         """
         Update the wind speed based on the current time and sinusoidal variations. Returns the speed value at this moment
+
+        :param now: Current time in milliseconds, from pygame.time.get_ticks(). Read from the clock if it's None.
         """
-        t = (pygame.time.get_ticks() - self.start_time) / 1000  # Time in seconds
+        if now is None: now = pygame.time.get_ticks()
+        t = (now - self.start_time) / 1000  # Time in seconds
 
         # Generate a sinusoidal value for regular wind
-        max_speed = self.base_max_speed 
-        dif_speed =  (self.base_max_speed * self.amplitude) // 100 
-        mean_speed = max_speed - dif_speed
- 
-        base_var = dif_speed*math.sin(2 * math.pi * self.freq_base/1000 * t)
-
-        base_wind = mean_speed+base_var
-
-        # Generate a series of sinusoidal gusts
-        gusts_sum = 0
-        for i in range(10):
-            gusts_var = math.sin(2 * math.pi * (i+1) * self.freq_gusts/500 * t)
-            gusts_sum += self.gusts * gusts_var
-
-        # When gusts value is close to 0, a new base speed is established the gusts
-        if -0.01 < gusts_var < 0.01:
+        base_wind = self._mean_speed + self._dif_speed * math.sin(self._base_omega * t)
+
+        # Generate a series of sinusoidal gusts: the harmonics sin(k*theta) for k = 1..10.
+        # Each harmonic comes from the previous two with sin((k+1)x) = 2cos(x)sin(kx) - sin((k-1)x),
+        # so only one sin and one cos are evaluated per frame.
+        theta = self._gust_omega * t
+        two_cos = 2 * math.cos(theta)
+        prev_var, gusts_var = 0.0, math.sin(theta)
+        harmonics_sum = gusts_var
+        for _ in range(9):
+            prev_var, gusts_var = gusts_var, two_cos * gusts_var - prev_var
+            harmonics_sum += gusts_var
+        gusts_sum = self.gusts * harmonics_sum
+
+        # When the gusts value crosses 0, a new base speed is established for the gusts.
+        # A sign change can't be missed between two frames like a small window around 0 can.
+        if self._last_gusts_var * gusts_var <= 0:
             self.gusts = random.uniform(self.max_gusts // 2, self.max_gusts)
+        self._last_gusts_var = gusts_var
 
         # Add the base value and the gust to get the total speed
         self.speed = base_wind + gusts_sum
@@ -244,6 +266,8 @@ class Precipitation:
     :param pixel: If True, the flake will be drawn as a square instead of a circle.
     """
 
+    _sprite_cache: dict = {}  # Drop sprites shared by all precipitations. The key holds the scale and every drawing parameter
+
     def __init__(self, weather, screen: pygame.Surface, width: int, height: int, initial_speed: int, acc: int,
                  color: tuple[int, int, int, int], num_drops: int, flake: bool = False, pixel: bool = False, is_hail=False):
         self.screen = screen
@@ -258,47 +282,84 @@ class Precipitation:
 
         self.num_drops = num_drops
         self.drops = [] #List to store all the drops from the current class
+        self._rotations = {} # Rotated sprites shared by this effect's drops, freed with it. The key is (sprite, number of rotation steps)
 
 
     def create_drop(self, screen, initial_speed, acc, flake, is_hail):
 
         scale = 0.35 + 0.65 * random.random()
         weight = scale*0.9
-        w, h = int(scale * self.width), int(scale * self.height)
         speed = scale * initial_speed
         acceleration = scale * acc / 100  # The bigger the more it accelerates
 
-        pic = pygame.Surface((w, h), pygame.SRCALPHA, 32).convert_alpha()
+        if flake:
+            weight /= 2
+
+        # Sprites are shared between drops of similar size, so the scale of the sprite is rounded to 1/16
+        pic = self.get_sprite(round(scale * 16) / 16, flake)
+
+        if is_hail: new_drop = Hail.Drop(speed, acceleration, weight, pic, screen, self._rotations)
+        else: new_drop = self.Drop(speed, acceleration, weight, pic, screen, self._rotations)
+        
+        self.drops.append(new_drop)
+
+        # Once all the drops exist, group them by sprite size so blits gets runs of the same source surface.
+        # Smallest first, so the big (nearer) drops are drawn on top of the small ones
+        if len(self.drops) == self.num_drops:
+            self.drops.sort(key=lambda drop: drop.size[0] * drop.size[1])
+
+    def get_sprite(self, scale: float, flake: bool) -> pygame.Surface:
+        """
+        Return the sprite of a drop of this precipitation at the given scale, drawing it only the first time.
+        The sprite has its colors premultiplied by its alpha, so it has to be blitted with pygame.BLEND_PREMULTIPLIED.
+
+        :param scale: Size of the drop relative to the max width and height.
+        :param flake: If True, a circle (or square, if pixel is True) is drawn at the lower part of the sprite.
+        """
+        key = (scale, self.width, self.height, self.color, flake, self.pixel)
+        pic = Precipitation._sprite_cache.get(key)
+        if pic is not None:
+            return pic
+
+        w, h = int(scale * self.width), int(scale * self.height)
+        pic = pygame.Surface((w, h), pygame.SRCALPHA)
         r, g, b, a = self.color
 
         transparency_tail_x = [1 - abs((i - w // 2) / (w // 2)) for i in range(w)]
         transparency_tail_y = (a * scale) / h
 
+        # The alpha of the tail is a horizontal fade times a vertical fade. Each fade is filled
+        # once per column/row and pygame multiplies both surfaces, instead of filling pixel by pixel.
+        # Both surfaces start fully transparent, so columns and rows with an alpha of 0 are not filled.
+        for i in range(w):
+            alphax = int(255 * transparency_tail_x[i] ** 2)
+            if alphax:
+                pic.fill((r, g, b, alphax), (i, 0, 1, h - w))
+
+        fade_y = pygame.Surface((w, h), pygame.SRCALPHA)
         for j in range(h - w):
-            for i in range(w):
-                alphax = transparency_tail_x[i] ** 2
-                alphay = transparency_tail_y * j
-                rect = (i, j, 1, 1)  # Pixel in position i,j
-                pic.fill((r, g, b, int(alphay * alphax)), rect)
+            alphay = int(transparency_tail_y * j)
+            if alphay:
+                fade_y.fill((255, 255, 255, alphay), (0, j, w, 1))
+        pic.blit(fade_y, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
         if flake:
-            weight /= 2
             if self.pixel:
                 pygame.draw.rect(pic, (r, g, b, 255), (w // 4, h - w, w // 2, w // 2))
             else:
                 pygame.draw.circle(pic, (r, g, b, 255), (w // 2, h - w), w // 4)
 
-        if is_hail: new_drop = Hail.Drop(speed, acceleration, weight, pic, screen)
-        else: new_drop = Precipitation.Drop(speed, acceleration, weight, pic, screen)
-        
-        self.drops.append(new_drop)
+        # Premultiplied sprites are blended with a cheaper formula. Rotating them keeps them premultiplied
+        pic = pic.premul_alpha()
+        Precipitation._sprite_cache[key] = pic
+        return pic
 
-    def update(self, wind_speed: float = 0) -> list[pygame.Rect]:
+    def update(self, wind_speed: float = 0, now: int | None = None) -> None:
         """
         Update and render all precipitation drops.
 
         :param wind_speed: The current speed of the wind affecting the precipitation.
-        :return: A list of rectangles to be updated.
+        :param now: Current time in milliseconds. Unused, drops only move per frame.
         """
 
         # Add or delete drops until there are the same as self.num_drops
@@ -307,21 +368,21 @@ class Precipitation:
         elif len(self.drops) > self.num_drops:
             del self.drops[0]
 
-        # Update the rectangles where the drops are now and where they were in the last loop.
-        update_rects = []
-        for drop in self.drops:
-            r = drop.render(self.screen, wind_speed)
-            if r:
-                i = r.collidelist(update_rects)
-                if i > -1:
-                    update_rects[i].union_ip(r)
-                else:
-                    update_rects.append(r)
-        return update_rects
+        # Draw every visible drop with a single call instead of one blit per drop
+        blit_seq = [blit for blit in [drop.render(wind_speed) for drop in self.drops] if blit]
+        self.screen.blits(blit_seq, doreturn=False)
 
     class Drop:
         """A single drop used by the precipitation generator."""
-        def __init__(self, speed: float, acc: float, weight: float, pic: pygame.Surface, screen: pygame.Surface):
+
+        # Every effect keeps dozens of drops alive and reads their attributes every frame
+        __slots__ = ('pic', 'size', 'ini_speed', 'acceleration', 'weight', 'wind_coupling', 'screen_w', 'screen_h',
+                     'pos', 'current_speed_x', 'current_speed_y', '_rotations', '_last_steps', '_last_rot')
+
+        rotation_step = 2    # Degrees between the pre-rotated versions of a sprite
+        _steps_per_radian = 180 / math.pi / rotation_step # Converts a tilt in radians straight to rotation steps
+
+        def __init__(self, speed: float, acc: float, weight: float, pic: pygame.Surface, screen: pygame.Surface, rotations: dict):
             """
             Initialize a precipitation drop.
 
@@ -330,6 +391,7 @@ class Precipitation:
             :param pic: The Pygame surface representing the drop.
             :param: Weight of the drop from 0 to 1. The higher it is the less it's afected by the wind direction
             :param screen: The Pygame screen where the drop will be drawn.
+            :param rotations: Rotated sprites of the drop's precipitation, filled as new angles are needed.
             """
             self.pic = pic
             self.size = pic.get_size()
@@ -337,80 +399,110 @@ class Precipitation:
             self.ini_speed = speed
             self.acceleration = acc
             self.weight = weight
+            self.wind_coupling = (1 - weight)**2 # How strongly the wind pulls the drop, fixed for its whole life
 
             self.screen_w = screen.get_width()
             self.screen_h = screen.get_height()
 
             self.pos = [random.random() * self.screen_w, -random.randint(-self.screen_h, self.screen_h)]
             self.current_speed_x = 0
-            self.current_speed_y = self.ini_speed * random.uniform(1, 1.5)
+            self.current_speed_y = self.ini_speed * (1 + 0.5 * random.random())
+
+            self._rotations = rotations
+
+            # Rotation used in the last frame. The wind changes slowly, so most frames reuse it
+            self._last_steps = 0
+            self._last_rot = pic
 
         def _reset_on_top(self, wind_speed) -> None:
             """Restart the drop at the top of the screen."""
-            self.current_speed_y = self.ini_speed * random.uniform(1, 1.5)
+            self.current_speed_y = self.ini_speed * (1 + 0.5 * random.random())
             self.current_speed_x = self.current_speed_x//2 + wind_speed//4
             self.pos = [random.random() * self.screen_w, - self.size[1]]
 
         def _reset_on_sides(self, left: bool) -> None:
             """Restart the drop on one side of the screen."""
-            self.current_speed_y = self.ini_speed * random.uniform(1, 1.5)
+            self.current_speed_y = self.ini_speed * (1 + 0.5 * random.random())
             if left:   self.pos = [-self.size[0], random.random() * self.screen_h]
             else:      self.pos = [self.screen_w, random.random() * self.screen_h]
 
-        def render(self, screen: pygame.Surface, wind_speed: float) -> pygame.Rect | None:
+        def _tilted_pic(self) -> pygame.Surface:
+            """Return the drop's pic rotated to its direction of movement, rounded to rotation_step degrees."""
+            # Tilt angle (in radians) converted to rotation steps with a single multiplication
+            steps = round(math.atan2(self.current_speed_x, self.current_speed_y) * self._steps_per_radian)
+            if steps == self._last_steps:
+                return self._last_rot
+            self._last_steps = steps
+            if not steps:
+                self._last_rot = self.pic
+                return self.pic
+
+            key = (self.pic, steps)
+            rotated_pic = self._rotations.get(key)
+            if rotated_pic is None:
+                rotated_pic = pygame.transform.rotate(self.pic, steps * self.rotation_step)
+                self._rotations[key] = rotated_pic
+            self._last_rot = rotated_pic
+            return rotated_pic
+
+        def render(self, wind_speed: float) -> tuple[pygame.Surface, tuple[float, float], None, int] | None:
             """
-            Updates the position/speed of the drop and then draws it on the screen.
+            Updates the position/speed of the drop and returns what to draw. The drawing itself is
+            done by Precipitation.update for all the drops at once.
 
-            :param screen: The Pygame screen where the drop will be drawn.
             :param wind_speed: The current wind speed affecting the drop current_speed_x.
-            :return: The rectangle area where the drop was drawn.
+            :return: The drop's surface, the position to draw it at, no area and the premultiplied blend flag,
+                     as expected by Surface.blits, or None if the drop is outside the screen.
             """
 
-            oldrect = self.pic.get_rect()
-
             rotated_pic = self.pic  # Initialize to the default picture
 
             if wind_speed:
-                dx = (wind_speed - self.current_speed_x)*(1 - self.weight)**2
+                speed_x = self.current_speed_x
+                dx = (wind_speed - speed_x)*self.wind_coupling
                 
-                self.current_speed_x += dx/1000
-                if self.current_speed_x > 1: self.current_speed_x -= (self.current_speed_x**0.5) / 100 
-                elif self.current_speed_x < -1: self.current_speed_x += ((abs(self.current_speed_x))**0.5) / 100
-                self.pos[0] += self.current_speed_x
-
-                # Calculate tilt angle (in radians)
-                tilt_angle = math.atan2(self.current_speed_x, self.current_speed_y)
+                speed_x += dx/1000
+                # Drag pulls the horizontal speed back towards 0 once it is faster than 1 in either direction
+                if abs(speed_x) > 1:
+                    speed_x -= math.copysign(math.sqrt(abs(speed_x)) / 100, speed_x)
+                self.current_speed_x = speed_x
+                self.pos[0] += speed_x
 
-                # Rotate the drop's pic surface
-                rotated_pic = pygame.transform.rotate(self.pic, math.degrees(tilt_angle))
+                # Pick the drop's pic surface rotated to the nearest step
+                rotated_pic = self._tilted_pic()
 
+            screen_w = self.screen_w
             if self.pos[0] < -51:
                 self._reset_on_sides(left=False)
-            if self.pos[0] > self.screen_w + 15:
+            elif self.pos[0] > screen_w + 15:
                 self._reset_on_sides(left=True)
 
-            # Update the drop's position
-            self.pos[1] += self.current_speed_y
+            # Update the drop's position. Bound after the side reset, which replaces the pos list
+            pos = self.pos
+            speed_y = self.current_speed_y
+            x = pos[0]
+            y = pos[1] = pos[1] + speed_y
 
-            newrect = pygame.Rect(self.pos[0], self.pos[1], self.size[0], self.size[1])
-            rect = oldrect.union(newrect)
+            # The rotated drop is drawn here, before a reset moves it. Drops outside the screen
+            # (above it after a reset, or blown past a side) are skipped, SDL would only clip them away
+            screen_h = self.screen_h
+            pic_w, pic_h = rotated_pic.get_size()
+            visible = -pic_w < x < screen_w and -pic_h < y < screen_h
+            blit = (rotated_pic, (x, y), None, pygame.BLEND_PREMULTIPLIED) if visible else None
 
-            # Draw the rotated drop
-            screen.blit(rotated_pic, self.pos)
+            self.current_speed_y = speed_y + self.acceleration
 
-            self.current_speed_y += self.acceleration
-
-            if self.pos[1] > self.screen_h:
+            if y > screen_h:
                 self._reset_on_top(wind_speed)
 
-            return rect
+            return blit
 
 class Rain(Precipitation):
     def __init__(self, weather, screen, height=150, width=10, initial_speed=15, acc=5, color=(150, 200, 255, 200), flake=False, num_drops=25):
         super().__init__(weather, screen, height=height, width=width, initial_speed=initial_speed, acc=acc, color=color, flake=flake, num_drops=num_drops)
 
         for i in range(4):
-            sound = pygame.mixer.Sound(f'assets/weather/rain/{i+1}.mp3')
+            sound = _load_sound(f'assets/weather/rain/{i+1}.mp3')
             weather.sounds.append(sound) 
 
             
@@ -476,13 +568,15 @@ class Hail(Precipitation):
         super().__init__(weather=weather, screen=screen, height=height, width=width, initial_speed=initial_speed, acc=acc, color=color,
                          flake=flake, num_drops=num_drops, pixel=pixel, is_hail=is_hail)
         for i in range(3):
-            sound = pygame.mixer.Sound(f'assets/weather/hail/{i+1}.mp3')
+            sound = _load_sound(f'assets/weather/hail/{i+1}.mp3')
             weather.sounds.append(sound)         
 
     class Drop(Precipitation.Drop):
         """A single hailstone drop, with the ability to bounce."""
 
-        def __init__(self, speed: float, acc: float, weight:float, pic: pygame.Surface, screen: pygame.Surface):
+        __slots__ = ('bounce_count',)
+
+        def __init__(self, speed: float, acc: float, weight:float, pic: pygame.Surface, screen: pygame.Surface, rotations: dict):
             """
             Initialize a hailstone drop.
 
@@ -490,31 +584,32 @@ class Hail(Precipitation):
             :param acc: The acceleration of the hailstone.
             :param pic: The Pygame surface representing the hailstone.
             :param screen: The Pygame screen where the hailstone will be drawn.
+            :param rotations: Rotated sprites of the hail, filled as new angles are needed.
             """
-            super().__init__(speed, acc, weight, pic, screen)
+            super().__init__(speed, acc, weight, pic, screen, rotations)
             self.bounce_count = 0  # Track the number of bounces
 
-        def render(self, screen: pygame.Surface, wind_speed: float) -> pygame.Rect | None:
+        def render(self, wind_speed: float) -> tuple[pygame.Surface, tuple[float, float], None, int] | None:
             """
             Render the hailstone, allowing it to bounce when it hits the bottom of the screen.
 
-            :param screen: The Pygame screen where the hailstone will be drawn.
             :param wind_speed: The current wind speed affecting the hailstone.
-            :return: The rectangle area where the hailstone was drawn.
+            :return: The hailstone's surface, the position to draw it at, no area and the premultiplied blend flag,
+                     as expected by Surface.blits, or None if the hailstone is outside the screen.
             """
-            rect = super().render(screen, wind_speed)
+            blit = super().render(wind_speed)
             
             if self.pos[1] >= (self.screen_h - 20*(1-self.weight)):
                 if self.bounce_count < 5:  # Limit the number of bounces
                     self.current_speed_y = -self.current_speed_y * 0.1 # Lose speed on bounce
-                    self.current_speed_x += random.randint(-5,5)
+                    self.current_speed_x += int(random.random() * 11) - 5  # Same as randint(-5, 5), without its Python-level overhead
                     self.bounce_count += 1
                 else:
                     self._reset_on_top(wind_speed)
-                    self.current_speed_x += random.randint(-5,5)
+                    self.current_speed_x += int(random.random() * 11) - 5
                     self.bounce_count = 0
 
-            return rect
+            return blit
 
 
 class Lightning:
@@ -531,10 +626,12 @@ class Lightning:
         self.frequency = frequency
         self.time_for_lightning = random.randint(self.frequency - self.frequency // 3, self.frequency + self.frequency // 3)
 
-        self.surface = pygame.Surface(self.screen.get_size())
+        # A single white surface in the display format, its alpha is the only thing changed during a flash
+        self.surface = pygame.Surface(self.screen.get_size()).convert()
         self.surface.fill((255, 255, 255))
         
         self.last_flash_time = pygame.time.get_ticks()
+        self._next_flash_at = self.last_flash_time + self.time_for_lightning # Time after which the next flash starts
         self.flash_active = False
         self.flash_step = 0
         self.step_duration = []
@@ -542,22 +639,20 @@ class Lightning:
         self.general_vol = weather.general_vol
         self.th_sounds = []
         for i in range(5):
-            sound = pygame.mixer.Sound(f'assets/weather/thunders/{i+1}.mp3')
+            sound = _load_sound(f'assets/weather/thunders/{i+1}.mp3')
             self.th_sounds.append(sound) 
 
-    def update(self, wind_sp) -> None:
+    def update(self, wind_sp, now: int | None = None) -> None:
         """
         Update the lightning effect, checking if a flash should start or continue.
-        """
-        current_time = pygame.time.get_ticks()
-        time_since_last_flash = current_time - self.last_flash_time
 
+        :param now: Current time in milliseconds, from pygame.time.get_ticks(). Read from the clock if it's None.
+        """
+        if now is None: now = pygame.time.get_ticks()
         if self.flash_active:  # Continue the flash if it is active
-            self._continue_flash(current_time)
-        elif time_since_last_flash > self.time_for_lightning:  # Checks if a flash should start
+            self._continue_flash(now)
+        elif now > self._next_flash_at:  # Checks if a flash should start
             self._start_flash()
-        
-        # print(self.step_duration, self.flash_step)
 
     def _start_flash(self) -> None:
         """Start a lightning flash event."""
@@ -600,6 +695,7 @@ class Lightning:
         # On the last step flash_active is swithed off
         elif self.flash_step >= self.flash_step_total: 
             self.flash_active = False
+            self._next_flash_at = self.last_flash_time + self.time_for_lightning
 
 
 class Fog:
@@ -612,6 +708,7 @@ class Fog:
     :param pixel: Bollean. If True, it will load a pixelated image.
     :param inertia: From 0 to 100. Being 0 means that the fog image almost follows wind speed, and 100 means that the wind barely affects the movement.
     """
+    _sources: dict = {} # Scaled noise images before tinting, shared by all fogs. The key is (pixel, screen size)
 
     def __init__(self, screen: pygame.Surface, density: float = 0.7, pixel: bool=False, drag = 0, color: tuple[int, int, int] = (20, 0, 20), inertia: int = 10):
         self.screen = screen
@@ -620,15 +717,21 @@ class Fog:
         self.color = color
         self.inertia = inertia 
         self.speed = 0 # Displacement of the image in x direction
-        self.y_ampl = random.random()*(self.screen_h // 4) # Amplitude of the sin function that controls the displacement of the image in y direction
+        self._max_y_ampl = self.screen_h // 4 # Also how far above the screen the fog is centered
+        self._wrap = self.screen_w*1.5        # Width of the fog image, where offsets wrap around
+        self.y_ampl = random.random()*self._max_y_ampl # Amplitude of the sin function that controls the displacement of the image in y direction
 
         self.load_images(density, color, pixel)
 
     def load_images(self, density, color, pixel):
-        # Load images
-        if pixel: img = pygame.image.load(f'assets/weather/NoisePix.png').convert_alpha()  # Available at https://danialc0.itch.io/tileable-fog 
-        else:     img = pygame.image.load(f'assets/weather/NoiseReg.png').convert_alpha() 
-        img = pygame.transform.scale(img, (self.screen_w*1.5 - 1, self.screen_h * 2))
+        # Load and scale the images only once, later calls (e.g. a density change or a new Fog) just tint a copy
+        key = (pixel, self.screen_w, self.screen_h)
+        if key not in Fog._sources:
+            if pixel: img = pygame.image.load(f'assets/weather/NoisePix.png').convert_alpha()  # Available at https://danialc0.itch.io/tileable-fog 
+            else:     img = pygame.image.load(f'assets/weather/NoiseReg.png').convert_alpha() 
+            Fog._sources[key] = pygame.transform.scale(img, (int(self._wrap) - 1, self.screen_h * 2))
+
+        img = Fog._sources[key].copy()
         img.set_alpha(int(255*density))
         
         color_surface = pygame.Surface(img.get_size())
@@ -636,22 +739,20 @@ class Fog:
         color_surface.set_alpha(100*density)
         img.blit(color_surface, (0, 0))
         
-        self.img = []
-        num_img = 2
-
-        for _ in range(num_img):    
-            self.img.append(img)
+        self.img = img # A single surface, blitted twice side by side
 
         # Position to start moving the fog from
-        self.offset_1 = -self.screen_w*1.5
+        self.offset_1 = -self._wrap
         self.offset_2 = 1
 
-    def update(self, wind_speed: float) -> None:
+    def update(self, wind_speed: float, now: int | None = None) -> None:
         """
         Update the fog effect, moving it across the screen based on wind speed.
 
         :param wind_speed: The current wind speed affecting the fog.
+        :param now: Current time in milliseconds, from pygame.time.get_ticks(). Read from the clock if it's None.
         """
+        if now is None: now = pygame.time.get_ticks()
         dx = (wind_speed - self.speed)
         self.speed += dx/(10*self.inertia)
 
@@ -659,27 +760,28 @@ class Fog:
         self.offset_1 += self.speed
        
         # Move the fog across the screen in y direction
-        y_movement = self.y_ampl * math.sin(pygame.time.get_ticks()/10_000)
-        y_pos = -(self.screen_h // 4) + y_movement
+        y_movement = self.y_ampl * math.sin(now/10_000)
+        y_pos = y_movement - self._max_y_ampl
 
         if -0.01 < y_pos < 0.01:
-            self.y_ampl = random()*(self.screen_h // 4)
+            self.y_ampl = random.random()*self._max_y_ampl
 
-        if self.offset_1 > self.screen_w*1.5:
-            self.offset_1 = -self.screen_w*1.5
-        elif self.offset_1 < -self.screen_w*1.5:
-            self.offset_1 = self.screen_w*1.5 
+        wrap = self._wrap
+        if self.offset_1 > wrap:
+            self.offset_1 = -wrap
+        elif self.offset_1 < -wrap:
+            self.offset_1 = wrap 
 
-        self.offset_2 = self.offset_1 + self.screen_w*1.5 if self.offset_1 <= 0 else self.offset_1 - self.screen_w*1.5
+        self.offset_2 = self.offset_1 + wrap if self.offset_1 <= 0 else self.offset_1 - wrap
         
-        # Blit the fog surface onto the screen
-        self.screen.blit(self.img[0], (self.offset_1, y_pos))
-        self.screen.blit(self.img[1], (self.offset_2, y_pos))
+        # Blit the fog surface onto the screen. The offsets keep their fractions so slow winds still move
+        # the fog, only the blit positions are truncated to whole pixels
+        y = int(y_pos)
+        self.screen.blits(((self.img, (int(self.offset_1), y)), (self.img, (int(self.offset_2), y))), doreturn=False)
 
 
 
 def main():
-    import time
     SCREENSIZE = 1200, 800
     PIXEL = True
 
@@ -689,8 +791,9 @@ def main():
 
     # Weather options: ['rain', 'acid rain', 'snow', 'hail', 'lightning', 'fog']
     weather = Weather(screen, weather_types=['rain', 'acid rain', 'snow', 'hail', 'lightning', 'fog'], pixel=PIXEL)
-    bgrd = pygame.image.load(f'assets/weather/imgpix.webp').convert_alpha() if PIXEL else pygame.image.load(f'assets/weather/img.webp').convert_alpha() 
-    bgrd = pygame.transform.scale(bgrd, (SCREENSIZE[0], SCREENSIZE[1]))
+    # The background is opaque, so it is converted without per-pixel alpha for a plain blit
+    bgrd = pygame.image.load(f'assets/weather/imgpix.webp').convert() if PIXEL else pygame.image.load(f'assets/weather/img.webp').convert() 
+    bgrd = pygame.transform.scale(bgrd, (SCREENSIZE[0], SCREENSIZE[1])).convert()
 
 
     while True:
@@ -701,14 +804,10 @@ def main():
         
         screen.blit(bgrd, (0,0))
 
-        start_time = time.time()
         weather.update()
         
         # Other game logic here
         
-        end_time = time.time()
-        # print(f'Time for each frame: {end_time - start_time:.6f} seconds')
-        
         pygame.display.flip()
         clock.tick(60)
 